@@ -1,15 +1,29 @@
+import asyncio
+import io
 import logging
 import os
 import subprocess
 from datetime import datetime
+from typing import Optional
 
 import discord
 from discord.ext import commands
 
 from roycemorebot import constants
 
+# Use uvloop's event loop if it's available (it isn't on Windows).
+# This has to happen before the bot is created, since it grabs the event loop.
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    uvloop.install()
+
 log = logging.getLogger("roycemorebot.main")
 
+MESSAGE_LIMIT = 2000
+
 
 # Change the bot class to log adding/removing cogs:
 class CogLoggingBot(commands.Bot):
@@ -18,12 +32,12 @@ class CogLoggingBot(commands.Bot):
     def add_cog(self, cog) -> None:  # noqa: ANN001
         """Add a cog and log it."""
         super().add_cog(cog)
-        log.info(f"Cog loaded: {cog.qualified_name}")
+        log.info("Cog loaded: %s", cog.qualified_name)
 
     def remove_cog(self, name) -> None:  # noqa: ANN001
         """Remove a cog and log it."""
         super().remove_cog(name)
-        log.info(f"Cog unloaded: {name}")
+        log.info("Cog unloaded: %s", name)
 
 
 # Create bot
@@ -44,13 +58,14 @@ bot.start_time = datetime.utcnow()
 @bot.event
 async def on_ready() -> None:
     """Message that the bot is ready."""
-    log.info(f"Logged in as {bot.user}")
+    log.info("Logged in as %s", bot.user)
 
-    log.trace(f"Time: {datetime.now()}")
+    now = datetime.now().astimezone()
+    log.trace("Time: %s", now)
     channel = bot.get_channel(constants.Channels.bot_log)
     embed = discord.Embed(
         description="Connected!",
-        timestamp=datetime.now().astimezone(),
+        timestamp=now,
         color=discord.Colour.green(),
     ).set_author(
         name=bot.user.display_name,
@@ -61,14 +76,16 @@ async def on_ready() -> None:
 
 
 # Load cogs
-for file in os.listdir(os.path.join(".", "roycemorebot", "exts")):
-    if file.endswith(".py") and not file.startswith("_"):
-        bot.load_extension(f"roycemorebot.exts.{file[:-3]}")
+with os.scandir(os.path.join("roycemorebot", "exts")) as entries:
+    for entry in entries:
+        name = entry.name
+        if entry.is_file() and name.endswith(".py") and not name.startswith("_"):
+            bot.load_extension(f"roycemorebot.exts.{name[:-3]}")
 
 
 # Log if debug mode is on
-log.info(f"Debug: {constants.DEBUG_MODE}")
-log.trace(f"Debug env variable: {os.environ['DEBUG']}")
+log.info("Debug: %s", constants.DEBUG_MODE)
+log.trace("Debug env variable: %s", os.environ.get("DEBUG"))
 
 
 @commands.has_any_role(*constants.BOT_ADMINS)
@@ -85,38 +102,69 @@ async def reload(ctx: commands.Context, cog: str) -> None:
         await ctx.send(f"Cog `{cog}` successfully reloaded!")
 
 
+async def _send_with_output(
+    ctx: commands.Context, message: str, output: Optional[str], filename: str
+) -> None:
+    """
+    Send `message` along with command output in a single message.
+
+    The output is shown inline if it fits within Discord's message length limit,
+    otherwise it is attached as a file called `filename`.
+    """
+    if not output:
+        await ctx.send(message)
+        return
+
+    inline = f"{message}\nCommand output:\n```\n{output}\n```"
+    if len(inline) <= MESSAGE_LIMIT:
+        await ctx.send(inline)
+    else:
+        file = discord.File(io.BytesIO(output.encode("utf-8")), filename=filename)
+        await ctx.send(f"{message}\nCommand output is attached.", file=file)
+
+
 @commands.has_any_role(*constants.BOT_ADMINS)
 @bot.command(name="git-pull", aliases=("gitpull", "gp"))
 async def git_pull(ctx: commands.Context) -> None:
     """Pull new changes."""
-    log.info(f"{ctx.author} ran a git pull")
+    log.info("%s ran a git pull", ctx.author)
+    args = ["git", "pull"]
     try:
-        c = subprocess.run(
-            ["git", "pull"],
-            capture_output=True,
-            check=True,
-            encoding="utf-8",
-            timeout=60,
+        # Run asynchronously so the event loop isn't blocked while pulling
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, 60) from None
+
+        stdout, stderr = stdout.decode("utf-8"), stderr.decode("utf-8")
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, args, stdout, stderr)
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
-        log.info(f"Command error! `{str(e)}`")
-        await ctx.send(
+        log.info("Command error! `%s`", e)
+
+        # Include output if available
+        stderr = getattr(e, "stderr", None)
+        log.trace("Output: %s", stderr)
+        await _send_with_output(
+            ctx,
             f"{constants.Emoji.warning} There was an error trying to execute that "
-            + f"command:\n```\n{str(e)}\n```"
+            + f"command:\n```\n{str(e)}\n```",
+            stderr,
+            "gitpull.log",
         )
-
-        # Print output if available
-        log.trace(f"Output: {e.stderr}")
-        if (
-            isinstance(e, (subprocess.TimeoutExpired, subprocess.SubprocessError))
-            and e.stderr
-        ):
-            await ctx.send(f"Command output:\n```\n{e.stderr}\n```")
     else:
         # Command worked
-        await ctx.send(f"{constants.Emoji.green_check} Command executed successfully.")
-        if c.stdout:
-            await ctx.send(f"Command output:\n```\n{c.stdout}\n```")
+        await _send_with_output(
+            ctx,
+            f"{constants.Emoji.green_check} Command executed successfully.",
+            stdout,
+            "gitpull.log",
+        )
 
 
 bot.run(constants.Bot.bot_token)
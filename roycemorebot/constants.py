@@ -1,18 +1,43 @@
-import json
 import logging
 import os
-from distutils.util import strtobool
 from pathlib import Path
+from typing import Union
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 log = logging.getLogger(__name__)
 
 if Path("config.json").exists():
     log.info("Found `config.json`, loading constants from it.")
-    with open("config.json", "r") as f:
-        _CONFIG_JSON = json.load(f)
+    _CONFIG_PATH = Path("config.json")
 else:
-    with open("config-default.json", "r") as f:
-        _CONFIG_JSON = json.load(f)
+    _CONFIG_PATH = Path("config-default.json")
+
+_CONFIG_JSON = _json_loads(_CONFIG_PATH.read_bytes())
+
+# Config value that is read from the environment instead
+_ENV_SENTINEL = "!ENV"
+
+
+def _resolve_env_values(config: dict) -> None:
+    """
+    Replace every `!ENV` value in `config` with its environment variable, in place.
+
+    The environment variable used is the upper-cased key of the value. Values whose
+    environment variable isn't set are left as `!ENV`, so that accessing them
+    reports the missing environment variable.
+    """
+    for key, value in config.items():
+        if isinstance(value, dict):
+            _resolve_env_values(value)
+        elif value == _ENV_SENTINEL and key.upper() in os.environ:
+            config[key] = os.environ[key.upper()]
+
+
+_resolve_env_values(_CONFIG_JSON)
 
 
 class JSONGetter(type):
@@ -48,34 +73,58 @@ class JSONGetter(type):
 
     subsection = None
 
+    def __init__(cls, name: str, bases: tuple, namespace: dict):
+        super().__init__(name, bases, namespace)
+
+        # Store annotated values as plain class attributes so they never hit
+        # `__getattr__`. Missing ones are left to fail (and log) on access.
+        for attr in getattr(cls, "__annotations__", {}):
+            try:
+                item = cls._resolve(attr.lower())
+            except KeyError:
+                continue
+            if item != _ENV_SENTINEL:
+                type.__setattr__(cls, attr, item)
+
+    def _resolve(cls, name: str) -> Union[str, int, dict]:
+        """Look up `name` in this class' section of the config, without logging."""
+        if cls.subsection is not None:
+            return _CONFIG_JSON[cls.section][cls.subsection][name]
+        return _CONFIG_JSON[cls.section][name]
+
     def __getattr__(cls, name: str):
-        name = name.lower()
+        # Special attributes are never config values, so let lookups like
+        # `__annotations__` on classes without annotations fail normally
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
 
         try:
-            if cls.subsection is not None:
-                item = _CONFIG_JSON[cls.section][cls.subsection][name]
-                if item == "!ENV":
-                    return os.environ[name.upper()]
-                else:
-                    return item
-            else:
-                item = _CONFIG_JSON[cls.section][name]
-                if item == "!ENV":
-                    return os.environ[name.upper()]
-                else:
-                    return item
+            item = cls._resolve(name.lower())
         except KeyError:
-            dotted_path = ".".join(
-                (cls.section, cls.subsection, name)
+            path = (
+                (cls.section, cls.subsection, name.lower())
                 if cls.subsection is not None
-                else (cls.section, name)
+                else (cls.section, name.lower())
             )
             log.critical(
-                f"Tried accessing configuration variable at `{dotted_path}`, "
-                + "but it could not be found."
+                "Tried accessing configuration variable at `%s`, "
+                "but it could not be found.",
+                ".".join(path),
             )
             raise
 
+        if item == _ENV_SENTINEL:
+            log.critical(
+                "Environment variable %s for `%s` is not set.",
+                name.upper(),
+                name.lower(),
+            )
+            raise KeyError(name.upper())
+
+        # Cache the value on the class so later lookups skip `__getattr__`
+        type.__setattr__(cls, name, item)
+        return item
+
     def __getitem__(cls, name: str):
         return cls.__getattr__(name)
 
@@ -86,10 +135,9 @@ class JSONGetter(type):
 
 
 # Debug mode
-try:
-    DEBUG_MODE = strtobool(os.environ["DEBUG"])
-except ValueError:
-    DEBUG_MODE = False
+# Accept the same true values as `distutils.util.strtobool`
+_TRUE_VALUES = {"y", "yes", "t", "true", "on", "1"}
+DEBUG_MODE = os.environ.get("DEBUG", "").strip().lower() in _TRUE_VALUES
 
 
 # JSON constants
@@ -197,8 +245,8 @@ class Emoji(metaclass=JSONGetter):
 
 
 # Groups
-BOT_ADMINS = [StaffRoles.bot_team_role, StaffRoles.admin_role]
-MOD_ROLES = [StaffRoles.mod_role, StaffRoles.admin_role]
+BOT_ADMINS = frozenset((StaffRoles.bot_team_role, StaffRoles.admin_role))
+MOD_ROLES = frozenset((StaffRoles.mod_role, StaffRoles.admin_role))
 CLASS_ROLES = [
     ClassRoles.grade_5,
     ClassRoles.grade_6,
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
 from discord import Colour, Embed
 from discord.ext import commands
@@ -10,6 +11,10 @@ from roycemorebot.constants import BOT_ADMINS, Channels, Emoji
 
 PRECISION = 3
 
+_GREEN = Colour.green()
+_ORANGE = Colour.orange()
+_RED = Colour.red()
+
 log = logging.getLogger(__name__)
 
 
@@ -22,19 +27,21 @@ class Status(commands.Cog):
     @commands.command(aliases=("latency",))
     async def ping(self, ctx: commands.Context) -> None:
         """View the latency of the bot."""
-        raw_bot_latency = (
-            datetime.utcnow() - ctx.message.created_at
-        ).total_seconds() * 1000
+        # `created_at` is a naive UTC datetime
+        created_at = ctx.message.created_at.replace(tzinfo=timezone.utc).timestamp()
+        raw_bot_latency = (time.time() - created_at) * 1000
         bot_latency = f"{raw_bot_latency:.{PRECISION}f} ms"
         raw_api_latency = self.bot.latency * 1000
         api_latency = f"{raw_api_latency:.{PRECISION}f} ms"
 
-        if raw_bot_latency <= 100 and raw_api_latency <= 100:
-            embed = Embed(title="Pong!", colour=Colour.green())
-        elif raw_bot_latency <= 250 and raw_api_latency <= 250:
-            embed = Embed(title="Pong!", colour=Colour.orange())
+        worst_latency = max(raw_bot_latency, raw_api_latency)
+        if worst_latency <= 100:
+            colour = _GREEN
+        elif worst_latency <= 250:
+            colour = _ORANGE
         else:
-            embed = Embed(title="Pong!", colour=Colour.red())
+            colour = _RED
+        embed = Embed(title="Pong!", colour=colour)
 
         embed.add_field(name="Bot latency:", value=bot_latency, inline=False)
         embed.add_field(name="Discord API Latency:", value=api_latency, inline=False)
@@ -76,7 +83,7 @@ class Status(commands.Cog):
         )
         await bot_log_channel.send(embed=embed)
 
-        log.info(f"Restarting at the request of {ctx.message.author}")
+        log.info("Restarting at the request of %s", ctx.message.author)
         await self.bot.logout()  # error on Windows: https://bugs.python.org/issue39232
         # restarted by PM2
 